@@ -4,19 +4,52 @@ import curses
 import logging
 import time
 from abc import ABC, abstractmethod
-from collections import namedtuple
 from copy import copy
 from curses import textpad
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import utils
 from client import Client
-from utils import resolve_direction, Window
+from utils import DATACLASS_SLOTS, inside_arena, resolve_direction, Window
 from utils import KeyPress, Vector
 
 logger = logging.getLogger('dogfight.base')
-BoundaryHit = namedtuple('BoundaryHit', 'top right bottom left')
+
+# bit flags for the sides of the arena boundary hit by an object
+HIT_TOP = 1
+HIT_RIGHT = 2
+HIT_BOTTOM = 4
+HIT_LEFT = 8
+
+# foreground color of each pair set up with `curses.init_pair`
+_INITIALIZED_PAIRS: Dict[int, int] = {}
+
+# animation frames, shared by every sprite instance as they are
+# read by index and never modified
+SMOKE_FRAMES = tuple('••ooO0oo00oo••')
+SMOKE_COLORS = tuple('11111111111111')
+EXPLOSION_FRAMES = tuple('x+x+x+•••.........')
+EXPLOSION_COLORS = tuple('111111111111111111')
+
+# angle offsets of explosion fragments when a plane is hit / destroyed
+HIT_SPREAD = tuple(i / 5 for i in range(-1, 2))
+DESTROYED_SPREAD = tuple(i / 3 for i in range(-2, 3))
+
+# planes keyed by the cell they occupy, for cannon hit detection
+PlaneCells = Dict[Tuple[int, int], List['Plane']]
+
+# plane nose character keyed by resolved (y, x) direction
+NOSE_GLYPHS = {
+    (0, -1): '-',
+    (0, 1): '-',
+    (1, -1): '/',
+    (1, 0): '|',
+    (1, 1): '\\',
+    (-1, -1): '\\',
+    (-1, 0): '|',
+    (-1, 1): '/',
+}
 
 
 @dataclass
@@ -33,6 +66,41 @@ class Arena:
         )
 
 
+@dataclass
+class FrameBuffer:
+    '''
+    Stands in for the curses `Window` while sprites draw a frame.
+
+    Cell writes are collected in `.changes` (the last write to a cell
+    wins) and `flush` only passes cells to curses that differ from what
+    was written on a previous frame, so a sprite that clears and redraws
+    the same cell costs no curses call at all.
+    '''
+    screen: Window
+
+    # pending writes for this frame and what is already on screen
+    changes: Dict[Tuple[int, int], Tuple[str, int]] = field(
+        default_factory=dict
+    )
+    shadow: Dict[Tuple[int, int], Tuple[str, int]] = field(
+        default_factory=dict
+    )
+
+    def addch(self, y: int, x: int, ch: str, attr: int = 0) -> None:
+        self.changes[(y, x)] = (ch, attr)
+
+    def flush(self) -> None:
+        '''
+        Write changed cells to the curses `Window`
+        '''
+        shadow = self.shadow
+        for yx, cell in self.changes.items():
+            if shadow.get(yx) != cell:
+                self.screen.addch(*yx, *cell)
+                shadow[yx] = cell
+        self.changes.clear()
+
+
 @dataclass
 class InfoBox(ABC):
 
@@ -42,12 +110,20 @@ class InfoBox(ABC):
     # where info box is placed relative to `Arena`
     anchor: str = field(default='top')
 
+    # how often the game calls `update`, in frames
+    UPDATE_EVERY_N_FRAMES = 1
+
     # dimensions to be defined in subclass __post_init__ method
     uly: int = field(init=False)
     ulx: int = field(init=False)
     lry: int = field(init=False)
     lrx: int = field(init=False)
 
+    # last message and attribute written to each line
+    last_lines: Dict[int, Tuple[str, Optional[int]]] = field(
+        default_factory=dict, init=False
+    )
+
     def draw(self) -> None:
         '''
         Draw box
@@ -63,7 +139,14 @@ class InfoBox(ABC):
     def _write(self, msg: str, line: int, attr: Optional[int] = None) -> None:
         '''
         Helper function to control placement of messages
+
+        Lines are only written when their content or attribute changed
+        since the previous call.
         '''
+        if self.last_lines.get(line) == (msg, attr):
+            return
+        self.last_lines[line] = (msg, attr)
+
         textbox_top = self.uly + 1
         textbox_left = self.ulx + 1
         if attr:
@@ -81,19 +164,42 @@ class InfoBox(ABC):
 @dataclass
 class TopBox(InfoBox):
 
+    # debug information does not need to follow every frame
+    UPDATE_EVERY_N_FRAMES = 3
+
+    # padded label prefixes, built once per label
+    prefixes: Dict[str, str] = field(default_factory=dict, init=False)
+
+    # values shown on the previous update
+    last_state: Optional[tuple] = field(default=None, init=False)
+
     def __post_init__(self):
         self.uly = utils.ULY - 6
         self.ulx = utils.ULX
         self.lry = utils.ULY - 1
         self.lrx = utils.LRX
+        self.boundaries = (
+            f'({utils.ULY}, {utils.ULX}), ({utils.LRY}, {utils.LRX})'
+        )
 
     def update(self, game, key_presses) -> None:
-        keys_pressed = ', '.join([str(k.key) for k in key_presses])
+        # skip formatting entirely while nothing shown has changed
+        # (extend `state` when enabling the commented-out lines below)
+        state = (
+            tuple(k.key for k in key_presses),
+            len(game.cannons),
+            tuple(p.plane.resolved_coords for p in game.players)
+        )
+        if state == self.last_state:
+            return
+        self.last_state = state
+
+        keys_pressed = ', '.join(str(k.key) for k in key_presses)
         # integrity = ', '.join(
         #     [str(p.plane.hull_integrity) for p in game.players]
         # )
         coords = ', '.join(
-            [str(p.plane.resolved_coords) for p in game.players]
+            str(p.plane.resolved_coords) for p in game.players
         )
 
         messages = {
@@ -101,105 +207,114 @@ class TopBox(InfoBox):
             'cannon in play': str(len(game.cannons)),
             # 'animations': str(len(game.animations)),
             'coords': coords,
-            'boundaries': (
-                f'({utils.ULY}, {utils.ULX}), ({utils.LRY}, {utils.LRX})'
-            ),
+            'boundaries': self.boundaries,
             # 'integrity': integrity
         }
 
-        for i, m in enumerate(messages.items()):
-            key = f'{m[0]: <15}: '
-            val = f'{m[1]: <15}'
-            self._write(key + val, line=i)
+        for i, (label, value) in enumerate(messages.items()):
+            prefix = self.prefixes.get(label)
+            if prefix is None:
+                prefix = self.prefixes[label] = label.ljust(15) + ': '
+            self._write(prefix + value.ljust(15), line=i)
 
 
 @dataclass
-class LowerLeftBox(InfoBox):
+class PlayerBox(InfoBox):
+    '''
+    Shows the kills, ammo and hull integrity of one `Player`.
+
+    Subclasses place the box and then call `_init_layout`, which
+    precomputes the column widths and bar used every frame.
+    '''
     anchor: str = 'bottom'
 
-    def __post_init__(self):
-        self.uly = utils.LRY + 1
-        self.ulx = utils.ULX
-        self.lry = utils.LRY + 5
-        self.lrx = utils.LRX - 1 - utils.ARENA_WIDTH // 2
+    # line of the ammo bar, overwritten while reloading
+    AMMO_LINE = 1
 
-        self.plane_idx: int = 0
+    # values shown on the previous update
+    last_state: Optional[Tuple[int, int, int, bool]] = field(
+        default=None, init=False
+    )
+
+    def _init_layout(self) -> None:
+        width = (utils.ARENA_WIDTH // 2) - 1
+        self.key_width = int(width * 0.4) - 1
+        self.val_width = int(width * 0.6) - 1
+
+        # a full bar, sliced to length when drawn
+        self.bar_scale = int(width * 0.6)
+        self.full_bar = '|' * self.bar_scale
+        self.reloading_row = (
+            'ammo'.ljust(self.key_width) + ': ' +
+            'reloading...'.ljust(self.val_width)
+        )
+
+    def _bar(self, fraction: float) -> str:
+        return self.full_bar[:max(int(fraction * self.bar_scale) - 1, 0)]
 
     def update(self, player: Player) -> None:
         plane = player.plane
         gun = plane.gun
 
-        messages = {
-            'kills': player.kills,
-            'ammo': plane.gun.rounds_in_chamber / plane.gun.capacity,
-            'integrity': plane.hull_integrity / 100
-        }
-
-        width = (utils.ARENA_WIDTH // 2) - 1
-        for i, m in enumerate(messages.items()):
-            bar_width = int(float(m[1]) * int(width * 0.6))
-            if m[0] == 'kills':
-                key = f'{m[0]: <{int(width * 0.4) - 1}}: '
-                val = f'{m[1]: <{int(width * 0.6) - 1}}'
-            else:
-                key = f'{m[0]: <{int(width * 0.4) - 1}}: '
-                val = f'{"|" * (bar_width - 1): <{int(width * 0.6) - 1}}'
-            self._write(key + val, line=i)
-
-        # special overwrite if gun is reloading
-        if gun.is_reloading:
-            ammo_idx = list(messages.keys()).index('ammo')
+        # nothing to rebuild if the displayed values are unchanged
+        state = (
+            player.kills,
+            gun.rounds_in_chamber,
+            plane.hull_integrity,
+            gun.is_reloading
+        )
+        if state == self.last_state:
+            return
+        self.last_state = state
+
+        rows = (
+            ('kills', str(player.kills)),
+            ('ammo', self._bar(gun.rounds_in_chamber / gun.capacity)),
+            ('integrity', self._bar(plane.hull_integrity / 100)),
+        )
+        for i, (label, value) in enumerate(rows):
+            # special row in place of the ammo bar if gun is reloading
+            if i == self.AMMO_LINE and gun.is_reloading:
+                self._write(
+                    self.reloading_row,
+                    line=i,
+                    attr=curses.A_BLINK
+                )
+                continue
             self._write(
-                f'{"ammo": <{int(width * 0.4) - 1}}: reloading...',
-                line=ammo_idx,
-                attr=curses.A_BLINK
+                label.ljust(self.key_width) + ': ' +
+                value.ljust(self.val_width),
+                line=i
             )
 
 
 @dataclass
-class LowerRightBox(InfoBox):
-    anchor: str = 'bottom'
+class LowerLeftBox(PlayerBox):
 
     def __post_init__(self):
         self.uly = utils.LRY + 1
-        self.ulx = utils.ULX + 1 + utils.ARENA_WIDTH // 2
+        self.ulx = utils.ULX
         self.lry = utils.LRY + 5
-        self.lrx = utils.LRX
+        self.lrx = utils.LRX - 1 - utils.ARENA_WIDTH // 2
 
-        self.plane_idx: int = 1
+        self.plane_idx: int = 0
+        self._init_layout()
 
-    def update(self, player) -> None:
-        plane = player.plane
-        gun = plane.gun
 
-        messages = {
-            'kills': player.kills,
-            'ammo': plane.gun.rounds_in_chamber / plane.gun.capacity,
-            'integrity': plane.hull_integrity / 100
-        }
+@dataclass
+class LowerRightBox(PlayerBox):
 
-        width = (utils.ARENA_WIDTH // 2) - 1
-        for i, m in enumerate(messages.items()):
-            bar_width = int(float(m[1]) * int(width * 0.6))
-            if m[0] == 'kills':
-                key = f'{m[0]: <{int(width * 0.4) - 1}}: '
-                val = f'{m[1]: <{int(width * 0.6) - 1}}'
-            else:
-                key = f'{m[0]: <{int(width * 0.4) - 1}}: '
-                val = f'{"|" * (bar_width - 1): <{int(width * 0.6) - 1}}'
-            self._write(key + val, line=i)
-
-        # special overwrite if gun is reloading
-        if gun.is_reloading:
-            ammo_idx = list(messages.keys()).index('ammo')
-            self._write(
-                f'{"ammo": <{int(width * 0.4) - 1}}: reloading...',
-                line=ammo_idx,
-                attr=curses.A_BLINK
-            )
+    def __post_init__(self):
+        self.uly = utils.LRY + 1
+        self.ulx = utils.ULX + 1 + utils.ARENA_WIDTH // 2
+        self.lry = utils.LRY + 5
+        self.lrx = utils.LRX
+
+        self.plane_idx: int = 1
+        self._init_layout()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AnimatedSprite:
     '''
     Define sprite art objects with a `.next_frame` method for animating
@@ -208,32 +323,39 @@ class AnimatedSprite:
     angle_of_attack: float = 0
     speed: float = 0
 
-    frames: list = field(init=False)
-    colors: list = field(init=False)
+    frames: Tuple[str, ...] = field(init=False)
+    colors: Tuple[str, ...] = field(init=False)
 
+    # index of the next frame to draw
+    frame_idx: int = 0
     for_deletion: bool = False
 
+    # cached direction of travel (see `direction`)
+    _direction: Optional[Vector] = field(
+        default=None, init=False, repr=False
+    )
+    _direction_angle: Optional[float] = field(
+        default=None, init=False, repr=False
+    )
+
     @property
-    def resolved_coords(self) -> Tuple[int, int]:
+    def direction(self) -> Vector:
         '''
-        Converts the "real" coordinates stored as `float` into
-        rounded integers to place the object on a curses `Window`
+        Returns the direction of travel resolved from `angle_of_attack`,
+        only recomputed when the angle changes
         '''
-        return self.coordinates.resolve()
+        if self._direction_angle != self.angle_of_attack:
+            self._direction = resolve_direction(self.angle_of_attack)
+            self._direction_angle = self.angle_of_attack
+        return self._direction
 
     @property
-    def inside_arena(self) -> bool:
+    def resolved_coords(self) -> Tuple[int, int]:
         '''
-        Returns True if coordinates are inside the arena boundary
+        Converts the "real" coordinates stored as `float` into
+        rounded integers to place the object on a curses `Window`
         '''
-        y, x = self.resolved_coords
-        inside_y = y > utils.ULY and y < utils.LRY
-        inside_x = x > utils.ULX and x < utils.LRX
-
-        if inside_y and inside_x:
-            return True
-        else:
-            return False
+        return self.coordinates.resolve()
 
     def next_frame(self, screen: Window) -> None:
         '''
@@ -243,46 +365,66 @@ class AnimatedSprite:
         `AnimatedSprite` are in an empty cell. Once empty, the animation
         is started.
 
-        Animation plays until 'frames' are exhausted.
+        Animation plays until every item in 'frames' has been drawn.
         '''
 
-        # clear previous frame if moving
-        if self.inside_arena:
-            screen.addch(*self.resolved_coords, ' ')
+        old_yx = self.resolved_coords
 
-        # update coordinates
-        self.coordinates += (
-            resolve_direction(self.angle_of_attack) *
-            self.speed
-        )
+        # update coordinates in place
+        direction = self.direction
+        self.coordinates.y += direction.y * self.speed
+        self.coordinates.x += direction.x * self.speed
 
         # draw next frame
-        if self.frames:
-            if self.inside_arena:
-                screen.addch(*self.resolved_coords, self.frames.pop(0))
-            else:
-                self.frames.pop(0)
+        yx = None
+        if self.frame_idx < len(self.frames):
+            yx = self.resolved_coords
+            if inside_arena(*yx):
+                screen.addch(*yx, self.frames[self.frame_idx])
+            self.frame_idx += 1
         else:
             self.for_deletion = True
 
+        # clear previous frame if it was not just drawn over
+        if old_yx != yx and inside_arena(*old_yx):
+            screen.addch(*old_yx, ' ')
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class PlaneSmoke(AnimatedSprite):
 
     def __post_init__(self):
-        self.frames: list = list('••ooO0oo00oo••')
-        self.colors: list = list('11111111111111')
+        self.frames = SMOKE_FRAMES
+        self.colors = SMOKE_COLORS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PlaneExplosion(AnimatedSprite):
 
     def __post_init__(self):
-        self.frames: List[str] = list('x+x+x+•••.........')
-        self.colors: List[str] = list('111111111111111111')
+        self.frames = EXPLOSION_FRAMES
+        self.colors = EXPLOSION_COLORS
 
+    @classmethod
+    def burst(
+        cls,
+        coordinates: Vector,
+        angle_of_attack: float,
+        speed: float,
+        spread: Tuple[float, ...]
+    ) -> List[PlaneExplosion]:
+        '''
+        Create one fragment per angle offset in `spread`, fanning out
+        from `coordinates` around `angle_of_attack`
+        '''
+        y, x = coordinates
+        return [
+            cls(Vector(y, x), angle_of_attack + offset, speed)
+            for offset in spread
+        ]
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Projectile:
     '''
     Describes any Projectile object.
@@ -305,6 +447,14 @@ class Projectile:
     animations: List[AnimatedSprite] = field(default_factory=list)
     for_deletion: bool = False
 
+    # cached direction of travel (see `direction`)
+    _direction: Optional[Vector] = field(
+        default=None, init=False, repr=False
+    )
+    _direction_angle: Optional[float] = field(
+        default=None, init=False, repr=False
+    )
+
     @property
     def resolved_coords(self) -> Tuple[int, int]:
         '''
@@ -313,6 +463,19 @@ class Projectile:
         '''
         return self.coordinates.resolve()
 
+    @property
+    def direction(self) -> Vector:
+        '''
+        Returns the direction of travel resolved from `angle_of_attack`.
+
+        The result is cached and only recomputed when the angle changes,
+        so it must not be modified in place.
+        '''
+        if self._direction_angle != self.angle_of_attack:
+            self._direction = resolve_direction(self.angle_of_attack)
+            self._direction_angle = self.angle_of_attack
+        return self._direction
+
     def _change_pitch(self, up: bool) -> None:
         ''''''
         if up:
@@ -320,27 +483,19 @@ class Projectile:
         elif not up:
             self.angle_of_attack -= self.turning_circle
 
-    def _hit_boundary(self, y: int, x: int) -> BoundaryHit:
+    def _hit_boundary(self, y: int, x: int) -> int:
         '''
-        Returns a namedtuple of four bools denoting whether a side of
-        the arena boundary has been hit
+        Returns an integer of `HIT_*` flags denoting which sides of the
+        arena boundary have been hit (0 if none)
         '''
-        hit_top, hit_right, hit_bottom, hit_left = False, False, False, False
-
-        # integers for top, right, bottom, left
-        if y <= utils.ULY:
-            hit_top = True
-        if x >= utils.LRX:
-            hit_right = True
-        if y >= utils.LRY:
-            hit_bottom = True
-        if x <= utils.ULX:
-            hit_left = True
-
-        bh = BoundaryHit(hit_top, hit_right, hit_bottom, hit_left)
-        return bh
+        return (
+            (y <= utils.ULY) * HIT_TOP |
+            (x >= utils.LRX) * HIT_RIGHT |
+            (y >= utils.LRY) * HIT_BOTTOM |
+            (x <= utils.ULX) * HIT_LEFT
+        )
 
-    def _react_to_boundary(self) -> Tuple[bool, bool]:
+    def _react_to_boundary(self) -> None:
         '''
         Controls consequences of hitting Arena boundary.
 
@@ -352,30 +507,32 @@ class Projectile:
         '''
 
         y, x = self.resolved_coords
-        bh = self._hit_boundary(y, x)
+        hit = self._hit_boundary(y, x)
+        if not hit:
+            return
         if self.infinite:
-            if bh.top:
+            # opposite sides cannot both be hit by a single step
+            if hit & HIT_TOP:
                 self.coordinates.y += utils.ARENA_HEIGHT
-            if bh.right:
-                self.coordinates.x -= utils.ARENA_WIDTH
-            if bh.bottom:
+            elif hit & HIT_BOTTOM:
                 self.coordinates.y -= utils.ARENA_HEIGHT
-            if bh.left:
+            if hit & HIT_RIGHT:
+                self.coordinates.x -= utils.ARENA_WIDTH
+            elif hit & HIT_LEFT:
                 self.coordinates.x += utils.ARENA_WIDTH
         else:
-            if any(list(bh)):
-                self.for_deletion = True
+            self.for_deletion = True
 
     def _move(self) -> None:
         '''
         Updates the coordinates of the Projectile object
         '''
 
-        # update coordinates based on speed and direction
-        self.coordinates += (
-            resolve_direction(self.angle_of_attack) *
-            self.speed
-        )
+        # update coordinates in place based on speed and direction,
+        # avoiding the temporary `Vector` objects created by arithmetic
+        direction = self.direction
+        self.coordinates.y += direction.y * self.speed
+        self.coordinates.x += direction.x * self.speed
 
         # ...then check if boundary is hit (execute action if so)
         self._react_to_boundary()
@@ -383,30 +540,21 @@ class Projectile:
     def draw(self, screen: Window) -> None:
         '''Draw object on terminal screen'''
 
-        # clear previous render of position of object
-        if not any(self._hit_boundary(*self.resolved_coords)):
-            screen.addch(*self.resolved_coords, ' ')
+        old_yx = self.resolved_coords
 
         # move object to new position
         self._move()
 
-        # render new position of object
-        if not any(self._hit_boundary(*self.resolved_coords)):
-            screen.addch(*self.resolved_coords, self.body)
-
-    def hit_check(self, obj: Projectile) -> bool:
-        '''
-        Pass `Coordinates` of another object and return True if equal
-        to the resolved coordinates of the `Projectile` instance.
-        '''
-        obj_y, obj_x = obj.coordinates.resolve()
-        if self.resolved_coords == (obj_y, obj_x):
-            return True
-        else:
-            return False
+        # render new position of object, clearing the previous one only
+        # if the object has moved to a different cell
+        yx = self.resolved_coords
+        if old_yx != yx and inside_arena(*old_yx):
+            screen.addch(*old_yx, ' ')
+        if inside_arena(*yx):
+            screen.addch(*yx, self.body)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Cannon(Projectile):
     # configuration
     turning_circle: float = field(default=0)
@@ -414,48 +562,70 @@ class Cannon(Projectile):
     body: str = '•'
     damage: int = 0
 
-    def _check_hits(self, planes: List[Plane]) -> bool:
+    def _check_hits(self, plane_cells: PlaneCells) -> bool:
         hit = False
-        for plane in planes:
-            if plane.hit_check(self):
-                curses.beep()
-                logger.debug(
-                    f'plane (id={id(plane)}) hit by cannon at '
-                    f'({self.resolved_coords[0] - utils.Y_SHIFT}, '
-                    f'{self.resolved_coords[1] - utils.X_SHIFT})'
+
+        # look up planes occupying the cannon's cell
+        coords = self.resolved_coords
+        for plane in plane_cells.get(coords, ()):
+            curses.beep()
+            logger.debug(
+                f'plane (id={id(plane)}) hit by cannon at '
+                f'({coords[0] - utils.Y_SHIFT}, '
+                f'{coords[1] - utils.X_SHIFT})'
+            )
+            plane.hull_integrity -= self.damage
+            hit = True
+            self.for_deletion = True
+            # play a "hit" animation
+            plane.animations.extend(
+                PlaneExplosion.burst(
+                    self.coordinates,
+                    self.angle_of_attack,
+                    self.speed * 0.5,
+                    HIT_SPREAD
                 )
-                plane.hull_integrity -= self.damage
-                hit = True
-                self.for_deletion = True
-                # play a "hit" animation
-                for i in range(-1, 2):
-                    plane.animations.append(
-                        PlaneExplosion(
-                            coordinates=self.coordinates,
-                            angle_of_attack=self.angle_of_attack + (i / 5),
-                            speed=self.speed * 0.5
-                        )
-                    )
+            )
 
         return hit
 
-    def update(self, screen: Window, planes: List[Plane]) -> None:
-        '''Draw object on terminal screen and calculate hit/damage'''
+    def update(self, screen: Window, plane_cells: PlaneCells) -> None:
+        '''
+        Draw object on terminal screen and calculate hit/damage.
+
+        `plane_cells` maps each occupied cell to the planes in it (see
+        `map_plane_cells`).
+        '''
 
-        # clear previous render of position of object
-        if not any(self._hit_boundary(*self.resolved_coords)):
-            screen.addch(*self.resolved_coords, ' ')
+        old_yx = self.resolved_coords
 
         # check if cannon hits plane. If no hit, move the cannon
-        if not self._check_hits(planes):
+        yx = None
+        if not self._check_hits(plane_cells):
             self._move()
             # render new position of cannon if the next move wasn't a hit
-            if not self._check_hits(planes):
-                if not any(self._hit_boundary(*self.resolved_coords)):
-                    screen.addch(*self.resolved_coords, self.body)
+            if not self._check_hits(plane_cells):
+                yx = self.resolved_coords
+                if inside_arena(*yx):
+                    screen.addch(*yx, self.body)
 
+        # clear previous render unless the cannon was just drawn there
+        if old_yx != yx and inside_arena(*old_yx):
+            screen.addch(*old_yx, ' ')
 
-@dataclass
+
+def map_plane_cells(planes: List[Plane]) -> PlaneCells:
+    '''
+    Group planes by their resolved coordinates so a cannon can find the
+    planes it hits with a single lookup
+    '''
+    plane_cells = {}
+    for plane in planes:
+        plane_cells.setdefault(plane.resolved_coords, []).append(plane)
+    return plane_cells
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Gun:
 
     # gun configuration
@@ -469,7 +639,7 @@ class Gun:
     is_reloading: bool = False
 
     def __post_init__(self):
-        self.rounds_in_chamber = copy(self.capacity)
+        self.rounds_in_chamber = self.capacity
 
     def reload_chamber(self, force: bool = False) -> None:
         '''
@@ -478,7 +648,7 @@ class Gun:
         '''
         time_elapsed = time.monotonic() - self.last_fired > self.reload_time
         if time_elapsed or force:
-            self.rounds_in_chamber = copy(self.capacity)
+            self.rounds_in_chamber = self.capacity
             self.is_reloading = False
 
     def fire(
@@ -507,7 +677,7 @@ class Gun:
             return c
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Plane(Projectile):
     '''
     Describes a Plane object
@@ -522,6 +692,7 @@ class Plane(Projectile):
     '''
 
     color_pair: int = None
+    color_attr: int = field(init=False, repr=False)
     gun: Gun = None
 
     body: str = '+'
@@ -533,44 +704,41 @@ class Plane(Projectile):
     hull_integrity: int = 100
     fired_cannon: List[Cannon] = field(default_factory=list)
 
+    # most recent smoke sprite left in each cell (internal bookkeeping)
+    smoke_cells: Dict[Tuple[int, int], PlaneSmoke] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
 
-        # initialise curses color pair
-        curses.init_pair(self.color_pair, self.color, -1)
+        # initialise curses color pair (unless already set up with the
+        # same color) and keep the resulting attribute for drawing
+        if _INITIALIZED_PAIRS.get(self.color_pair) != self.color:
+            curses.init_pair(self.color_pair, self.color, -1)
+            _INITIALIZED_PAIRS[self.color_pair] = self.color
+        self.color_attr = curses.color_pair(self.color_pair)
 
         # resolve nose coordinates and draw
-        _nc = (
-            round(self.coordinates) +
-            round(resolve_direction(self.angle_of_attack))
-        )
-        self.nose_coords = Vector(*_nc)
-        self._render_nose()
+        self._update_nose()
+
+    def _update_nose(self) -> None:
+        '''
+        Place the nose one cell ahead of the plane body, working on the
+        resolved integers rather than intermediate `Vector` objects
+        '''
+        y, x = self.resolved_coords
+        dy, dx = self.direction.resolve()
+        self.nose_coords = Vector(y + dy, x + dx)
+        self._render_nose(dy, dx)
 
-    def _render_nose(self) -> None:
+    def _render_nose(self, dy: int, dx: int) -> None:
         r'''
             \    |    /
         -+   x   +   x    +-  x   +   x
                                \  |  /
 
         '''
-        y, x = resolve_direction(self.angle_of_attack).resolve()
-
-        if y == 0:
-            self.nose = '-'
-        elif y == 1:
-            if x == 0:
-                self.nose = '|'
-            elif x == -1:
-                self.nose = '/'
-            elif x == 1:
-                self.nose = '\\'
-        elif y == -1:
-            if x == 0:
-                self.nose = '|'
-            elif x == -1:
-                self.nose = '\\'
-            elif x == 1:
-                self.nose = '/'
+        self.nose = NOSE_GLYPHS[(dy, dx)]
 
     def _fire_cannon(self) -> Optional[Cannon]:
         '''
@@ -579,80 +747,85 @@ class Plane(Projectile):
         '''
 
         # cannon starting position just ahead of the plane's nose
-        _nc = (
-            round(self.coordinates) +
-            round(resolve_direction(self.angle_of_attack)) +
-            round(resolve_direction(self.angle_of_attack))
-        )
-        c = self.gun.fire(copy(_nc), copy(self.angle_of_attack))
+        y, x = self.resolved_coords
+        dy, dx = self.direction.resolve()
+        _nc = Vector(y + 2 * dy, x + 2 * dx)
+        c = self.gun.fire(_nc, self.angle_of_attack)
         if c:
             return c
 
     def _move(self) -> None:
 
-        # call base class move method
-        super()._move()
+        # call base class move method (explicitly, as zero-argument
+        # `super()` does not work in slotted dataclasses)
+        Projectile._move(self)
 
         # extend base class to also adjust coordinates of "nose"
-        self.nose_coords = (
-            round(self.coordinates) +
-            round(resolve_direction(self.angle_of_attack))
-        )
-        self._render_nose()
+        self._update_nose()
 
     def draw(self, screen: Window) -> None:
         '''Override base draw() method to include drawing of nose'''
 
-        # clear previous render of position of plane
-        if not any(self._hit_boundary(*self.resolved_coords)):
-            screen.addch(*self.resolved_coords, ' ')
-        if not any(self._hit_boundary(*self.nose_coords)):
-            screen.addch(*self.nose_coords.resolve(), ' ')
+        # previous render of position of plane
+        old_cells = (self.resolved_coords, self.nose_coords.resolve())
 
         # create `PlaneSmoke` instance prior to move if hull integrity
         # below threshold
         if self.hull_integrity < 40:
-            anims_at_coords = [
-                a for a in self.animations
-                if a.resolved_coords == self.resolved_coords
-            ]
-            if not anims_at_coords:
-                self.animations.append(PlaneSmoke(self.coordinates))
+            smoke = self.smoke_cells.get(old_cells[0])
+            if smoke is None or smoke.for_deletion:
+                # forget finished sprites so only live smoke is tracked
+                self.smoke_cells = {
+                    yx: s for yx, s in self.smoke_cells.items()
+                    if not s.for_deletion
+                }
+                smoke = PlaneSmoke(copy(self.coordinates))
+                self.smoke_cells[old_cells[0]] = smoke
+                self.animations.append(smoke)
 
         # move plane to new position
         self._move()
 
         # render new position of plane if not destroyed
         # otherwise, mark plane for deletion and don't draw
+        new_cells = ()
         if self.hull_integrity > 0:
-            if not any(self._hit_boundary(*self.resolved_coords)):
+            body_yx = self.resolved_coords
+            nose_yx = self.nose_coords.resolve()
+            new_cells = (body_yx, nose_yx)
+            if inside_arena(*body_yx):
                 screen.addch(
-                    *self.resolved_coords,
+                    *body_yx,
                     self.body,
-                    curses.color_pair(self.color_pair)
+                    self.color_attr
                 )
-            if not any(self._hit_boundary(*self.nose_coords)):
+            if inside_arena(*nose_yx):
                 screen.addch(
-                    *self.nose_coords.resolve(),
+                    *nose_yx,
                     self.nose,
-                    curses.color_pair(self.color_pair)
+                    self.color_attr
                 )
         else:
+            y, x = self.resolved_coords
             logger.debug(
                 f'plane (id={id(self)}) destroyed at '
-                f'({self.resolved_coords[0] - utils.Y_SHIFT}, '
-                f'{self.resolved_coords[1] - utils.X_SHIFT})'
+                f'({y - utils.Y_SHIFT}, {x - utils.X_SHIFT})'
             )
-            for i in range(-2, 3):
-                self.animations.append(
-                    PlaneExplosion(
-                        coordinates=self.coordinates,
-                        angle_of_attack=self.angle_of_attack + (i / 3),
-                        speed=self.speed * 0.7
-                    )
+            self.animations.extend(
+                PlaneExplosion.burst(
+                    self.coordinates,
+                    self.angle_of_attack,
+                    self.speed * 0.7,
+                    DESTROYED_SPREAD
                 )
+            )
             self.for_deletion = True
 
+        # clear previous render, skipping cells that were just redrawn
+        for yx in old_cells:
+            if yx not in new_cells and inside_arena(*yx):
+                screen.addch(*yx, ' ')
+
 
 @dataclass
 class Player:
@@ -676,10 +849,10 @@ class Player:
             if k.player_id == self.player_id:
                 key = k.key
                 # isolate navigation controls
-                if key in ['up', 'down']:
+                if key == 'up' or key == 'down':
                     self.plane._change_pitch(up=key == 'up')
                 # ...otherwise fire cannon
-                if key == 'shoot':
+                elif key == 'shoot':
                     cannon_round = self.plane._fire_cannon()
                     if cannon_round:
                         self.plane.fired_cannon.append(cannon_round)
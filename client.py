@@ -2,19 +2,63 @@ import json
 import logging
 import socket
 import selectors
-from collections import namedtuple
-from typing import Dict, Optional
+from collections import deque, namedtuple
+from typing import Any, Deque, Dict, List, Optional
 
 
 logger = logging.getLogger(__name__)
 
+# every message is prefixed with its length as a 4-byte big-endian int
+HEADER_SIZE = 4
+
+# size of the preallocated buffer each socket read goes into
+RECV_BUFFER_SIZE = 4096
+
 
 SocketData = namedtuple(
     'SocketData',
-    'connid msg_total recv_total messages outb'
+    'connid msg_total recv_total'
 )
 
 
+def pack_message(msg: Dict[str, Any]) -> bytes:
+    '''
+    Encode `msg` as JSON behind a length prefix
+    '''
+    payload = json.dumps(msg).encode('utf-8')
+    return len(payload).to_bytes(HEADER_SIZE, 'big') + payload
+
+
+def pop_frame(buffer: bytearray) -> Optional[bytes]:
+    '''
+    Remove and return the payload of the first complete message in
+    `buffer`, or None if the whole message has not arrived yet
+    '''
+    if len(buffer) < HEADER_SIZE:
+        return None
+    end = HEADER_SIZE + int.from_bytes(buffer[:HEADER_SIZE], 'big')
+    if len(buffer) < end:
+        return None
+    payload = bytes(buffer[HEADER_SIZE:end])
+    del buffer[:end]
+    return payload
+
+
+def unpack_messages(buffer: bytearray) -> List[Dict[str, Any]]:
+    '''
+    Decode and remove every complete message at the start of `buffer`.
+
+    Bytes of a partially received message are left in `buffer` until the
+    rest arrives.
+    '''
+    messages = []
+    payload = pop_frame(buffer)
+    while payload is not None:
+        messages.append(json.loads(payload))
+        payload = pop_frame(buffer)
+    return messages
+
+
 class Client():
 
     def __init__(self, connid, host: str, port: int):
@@ -27,64 +71,105 @@ class Client():
         sock.setblocking(False)
         sock.connect_ex(server_addr)
 
-        # events to accept
-        events = selectors.EVENT_READ | selectors.EVENT_WRITE
-
         # initialise data block to track state of socket
         data = SocketData(
             connid=connid,
             msg_total=0,
-            recv_total=0,
-            messages=[],
-            outb=b''
+            recv_total=0
         )
-        self.sel.register(sock, events, data=data)
 
-    def receive(self) -> Dict[str, Optional[str]]:
-
-        recv_data = None
-
-        events = self.sel.select(timeout=3)
-        if events:
-            for key, mask in events:
-                if mask & selectors.EVENT_READ:
-                    sock = key.fileobj
-                    data = key.data
-                    recv_data = sock.recv(1024)
+        # wait once for the non-blocking connect to complete, then only
+        # watch for incoming data; a connected socket is always writable
+        # so selecting on writes would make `receive` return immediately
+        self.sel.register(sock, selectors.EVENT_WRITE, data=data)
+        self.sel.select(timeout=3)
+        self.sel.modify(sock, selectors.EVENT_READ, data=data)
+
+        self.sock = sock
+        self.data = data
+
+        # received bytes not yet decoded and decoded messages not yet
+        # returned by `receive`
+        self.inb = bytearray()
+        self.pending: Deque[Dict[str, Optional[str]]] = deque()
+
+        # reused for every read from the socket
+        self.recv_buffer = bytearray(RECV_BUFFER_SIZE)
+        self.recv_view = memoryview(self.recv_buffer)
+
+        # encoded bytes the socket has not accepted yet
+        self.outb = bytearray()
+
+    def receive(self) -> Optional[Dict[str, Optional[str]]]:
+        '''
+        Return the next message from the server, or None if nothing
+        arrived in time.
+
+        Raises `ConnectionError` once the server has closed the connection.
+        '''
+        if self.sock.fileno() == -1:
+            raise ConnectionError(
+                f'connection {self.data.connid} is closed'
+            )
+
+        if not self.pending:
+            for _, mask in self.sel.select(timeout=3):
+                if mask & selectors.EVENT_WRITE:
+                    self._flush()
+                if not mask & selectors.EVENT_READ:
+                    continue
+                n_bytes = self.sock.recv_into(self.recv_buffer)
 
-                    if recv_data:
-                        logger.debug(
-                            f'received {recv_data} from connection {data.connid}'
-                        )
-                    else:
-                        logger.debug(
-                            f'no data received, closing connection {data.connid}'
-                        )
-                        sock.close()
+                if n_bytes:
+                    logger.debug(
+                        f'received {n_bytes} bytes from connection '
+                        f'{self.data.connid}'
+                    )
+                    self.inb += self.recv_view[:n_bytes]
+                    self.pending.extend(unpack_messages(self.inb))
+                else:
+                    logger.debug(
+                        f'no data received, closing connection '
+                        f'{self.data.connid}'
+                    )
+                    self.sel.unregister(self.sock)
+                    self.sock.close()
+                    raise ConnectionError(
+                        f'server closed connection {self.data.connid}'
+                    )
 
-                    return json.loads(recv_data.decode('utf-8'))
+        if self.pending:
+            return self.pending.popleft()
+
+    def _flush(self) -> None:
+        '''
+        Send as much of `outb` as the socket accepts. Anything left is
+        sent by `receive` once the socket reports it is writable again,
+        so messages are never cut short on the wire.
+        '''
+        try:
+            sent = self.sock.send(self.outb)
+        except BlockingIOError:
+            sent = 0
+        del self.outb[:sent]
+
+        # only watch for writability while bytes are waiting to go out
+        events = selectors.EVENT_READ
+        if self.outb:
+            events |= selectors.EVENT_WRITE
+        if self.sel.get_key(self.sock).events != events:
+            self.sel.modify(self.sock, events, data=self.data)
 
     def send(self, msg: Dict[str, Optional[str]]) -> None:
 
-        events = self.sel.select(timeout=3)
-        if events:
-            for key, mask in events:
-                if mask & selectors.EVENT_WRITE:
-                    sock = key.fileobj
-                    data = key.data
-
-                    logger.debug(
-                        f'sending {msg} to connection {data.connid}'
-                    )
-                    send_json = json.dumps(msg).encode('utf-8')
-                    sock.send(send_json)  # Should be ready to write
+        logger.debug(f'sending {msg} to connection {self.data.connid}')
+        self.outb += pack_message(msg)
+        self._flush()
 
     def close(self):
 
-        events = self.sel.select(timeout=3)
-        for key, mask in events:
-            if mask & selectors.EVENT_READ:
-                sock = key.fileobj
-                self.sel.unregister(sock)
-                sock.close()
+        # the socket is already gone if the server closed it first
+        if self.sock.fileno() != -1:
+            self.sel.unregister(self.sock)
+            self.sock.close()
         self.sel.close()
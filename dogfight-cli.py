@@ -5,16 +5,21 @@ import logging
 import os
 import pathlib
 import sys
+import time
 
 from base import Arena, TopBox, LowerLeftBox, LowerRightBox, Window
 from game import LocalGame, Player, NetworkGame
 from menu import StartMenu
 
+# frame rate cap used unless --max-fps is given
+DEFAULT_MAX_FPS = 33
+
 # set env variable so that xterm can show ACS_* curses characters
 os.environ['NCURSES_NO_UTF8_ACS'] = '1'
 os.environ['DOGFIGHT_LOCAL'] = '1'
 os.environ['DOGFIGHT_LOGGING'] = '0'
 os.environ['DOGFIGHT_DEBUG'] = '0'
+os.environ['DOGFIGHT_MAX_FPS'] = str(DEFAULT_MAX_FPS)
 
 
 def init_logger(logging_on: bool = False) -> logging.Logger:
@@ -48,8 +53,6 @@ def main(stdscr: Window):
     # initial curses settings
     curses.use_default_colors()
     curses.curs_set(0)  # hides cursor
-    stdscr.nodelay(1)   #
-    stdscr.timeout(30)  # controls refresh rate
 
     # initialise logging
     if os.environ['DOGFIGHT_LOGGING'] == '1':
@@ -70,6 +73,14 @@ def main(stdscr: Window):
     elif settings['game_type'] == 'Network':
         game_class = NetworkGame
 
+    # game loop no longer waits on the keyboard; frames are paced below
+    stdscr.timeout(0)
+    frame_period = 1 / int(os.environ['DOGFIGHT_MAX_FPS'])
+
+    # cursor position is irrelevant once the game is running, so let
+    # curses skip moving it on every update
+    stdscr.leaveok(True)
+
     # redraw fresh arena
     arena.draw()
 
@@ -91,12 +102,17 @@ def main(stdscr: Window):
     game = game_class(stdscr, debug_box, settings, players)
     while True:
         try:
+            frame_start = time.monotonic()
             if not game.is_started:
                 stdscr.refresh()
                 game.start_game()
             key_presses = game.read_key()
             game.next_frame(key_presses)
-            stdscr.refresh()
+            game.render()
+            # sleep off the rest of the frame to cap the frame rate
+            remaining = frame_period - (time.monotonic() - frame_start)
+            if remaining > 0:
+                time.sleep(remaining)
         except KeyboardInterrupt:
             game.close_game()
             sys.exit(
@@ -104,6 +120,9 @@ def main(stdscr: Window):
                 f'({players[0].callsign}) {players[0].kills}:'
                 f'{players[1].kills} ({players[1].callsign})'
             )
+        except ConnectionError as err:
+            game.close_game()
+            sys.exit(f'Closed game... lost connection to server ({err})')
 
 
 if __name__ == '__main__':
@@ -114,10 +133,17 @@ if __name__ == '__main__':
     parser.add_argument(
         '-D', '--debug', action='store_true', help='enable debug info box'
     )
+    parser.add_argument(
+        '--max-fps', type=int, default=DEFAULT_MAX_FPS,
+        help='cap on frames per second'
+    )
     args = parser.parse_args()
+    if args.max_fps < 1:
+        parser.error('--max-fps must be at least 1')
     if args.logging:
         os.environ['DOGFIGHT_LOGGING'] = '1'
     if args.debug:
         os.environ['DOGFIGHT_DEBUG'] = '1'
+    os.environ['DOGFIGHT_MAX_FPS'] = str(args.max_fps)
 
     curses.wrapper(main)
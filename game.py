@@ -7,8 +7,9 @@ from copy import copy
 from dataclasses import dataclass, field
 from typing import List
 
-from base import TopBox, Window
+from base import FrameBuffer, TopBox, Window
 from base import AnimatedSprite, Plane, Player, Projectile
+from base import map_plane_cells
 from client import Client
 from planes import BF109, P51
 from utils import ARENA_HEIGHT, ARENA_WIDTH, LRX, LRY, ULX, ULY
@@ -20,6 +21,8 @@ START_COORDS_ONE = Vector(START_COORDS_Y, ULX + (ARENA_WIDTH // 4))
 START_COORDS_TWO = Vector(START_COORDS_Y, LRX - (ARENA_WIDTH // 4))
 START_ANGLE_ONE = math.pi * -1/2
 START_ANGLE_TWO = math.pi * 1/2
+START_COORDS = (START_COORDS_ONE, START_COORDS_TWO)
+START_ANGLES = (START_ANGLE_ONE, START_ANGLE_TWO)
 CALLSIGN_ONE = Vector(ULY, ULX + 2)
 CALLSIGN_TWO = Vector(ULY, LRX - 22)
 
@@ -39,6 +42,7 @@ P_TWO_YOKE = {
     ord('s'): 'down',
     ord('d'): 'shoot'
 }
+YOKES = (P_ONE_YOKE, P_TWO_YOKE)
 
 
 @dataclass
@@ -57,6 +61,13 @@ class Game(ABC):
 
     # track game state
     is_started: bool = False
+    frame_count: int = 0
+
+    # buffers sprite drawing between frames
+    canvas: FrameBuffer = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.canvas = FrameBuffer(self.screen)
 
     def _provision_planes(self) -> List[Plane]:
         '''
@@ -64,16 +75,14 @@ class Game(ABC):
         provisioned_planes = []
 
         planes = [BF109, P51]
-        color_pairs = [1, 2]
-        start_coords = [copy(START_COORDS_ONE), copy(START_COORDS_TWO)]
-        start_angles = [copy(START_ANGLE_ONE), copy(START_ANGLE_TWO)]
 
-        for p in planes:
+        # planes move their coordinates in place, so each gets a copy
+        for i, p in enumerate(planes):
             provisioned_planes.append(
                 p(
-                    color_pair=color_pairs.pop(0),
-                    coordinates=start_coords.pop(0),
-                    angle_of_attack=start_angles.pop(0),
+                    color_pair=i + 1,
+                    coordinates=copy(START_COORDS[i]),
+                    angle_of_attack=START_ANGLES[i],
                 )
             )
 
@@ -129,8 +138,9 @@ class Game(ABC):
             # render updated plane state
             player.parse_key(key_presses)
             if plane.fired_cannon:
-                self.cannons.append(plane.fired_cannon.pop(0))
-            plane.draw(self.screen)
+                self.cannons.extend(plane.fired_cannon)
+                plane.fired_cannon.clear()
+            plane.draw(self.canvas)
 
             # update state of gun
             if plane.gun.is_reloading:
@@ -139,24 +149,55 @@ class Game(ABC):
             # pass any generated animation to game instance
             if plane.animations:
                 self.animations.extend(plane.animations)
-                plane.animations = []
+                plane.animations.clear()
 
             # update player info box
-            player.info_box.update(player)
+            info_box = player.info_box
+            if self.frame_count % info_box.UPDATE_EVERY_N_FRAMES == 0:
+                info_box.update(player)
 
         # === update cannon rounds ===
-        self.cannons = [c for c in self.cannons if not c.for_deletion]
-        for cannon in self.cannons:
-            cannon.update(self.screen, [p.plane for p in self.players])
+        # spent rounds are compacted out in place while updating the rest
+        plane_cells = map_plane_cells([p.plane for p in self.players])
+        cannons = self.cannons
+        live = 0
+        for cannon in cannons:
+            if cannon.for_deletion:
+                continue
+            cannon.update(self.canvas, plane_cells)
+            cannons[live] = cannon
+            live += 1
+        del cannons[live:]
 
         # === play animations ===
-        self.animations = [a for a in self.animations if not a.for_deletion]
-        for anim in self.animations:
-            anim.next_frame(self.screen)
+        animations = self.animations
+        live = 0
+        for anim in animations:
+            if anim.for_deletion:
+                continue
+            anim.next_frame(self.canvas)
+            animations[live] = anim
+            live += 1
+        del animations[live:]
+
+        # === write sprite changes to screen ===
+        self.canvas.flush()
 
         # === update game info ===
-        if self.debug_box:
-            self.debug_box.update(self, key_presses)
+        debug_box = self.debug_box
+        if debug_box:
+            if self.frame_count % debug_box.UPDATE_EVERY_N_FRAMES == 0:
+                debug_box.update(self, key_presses)
+
+        self.frame_count += 1
+
+    def render(self) -> None:
+        '''
+        Push everything written during the frame to the terminal with a
+        single `doupdate`, letting curses send one diff per frame
+        '''
+        self.screen.noutrefresh()
+        curses.doupdate()
 
     def start_game(self) -> None:
         '''
@@ -176,19 +217,17 @@ class Game(ABC):
         '''
         Reset state of plane
         '''
-        start_coords = [copy(START_COORDS_ONE), copy(START_COORDS_TWO)]
-        start_angles = [copy(START_ANGLE_ONE), copy(START_ANGLE_TWO)]
-
         for i, player in enumerate(self.players):
-            if id(plane) == id(player.plane):
+            if player.plane is plane:
                 plane.hull_integrity = 100
-                plane.gun.rounds_in_chamber = copy(plane.gun.capacity)
-                plane.coordinates = start_coords[i]
-                plane.angle_of_attack = start_angles[i]
+                plane.gun.rounds_in_chamber = plane.gun.capacity
+                plane.coordinates = copy(START_COORDS[i])
+                plane.angle_of_attack = START_ANGLES[i]
                 plane.for_deletion = False
+                plane.smoke_cells.clear()
                 if plane.gun.is_reloading:
                     plane.gun.reload_chamber(force=True)
-            if id(plane) != id(player.plane):
+            else:
                 player.kills += 1
 
     def close_game(self) -> None:
@@ -216,17 +255,23 @@ class LocalGame(Game):
         self._draw_player_names()
 
     def read_key(self) -> List[KeyPress]:
-        key_presses = []
-        yokes = [P_ONE_YOKE, P_TWO_YOKE]
+        # drain every pending key so both players are heard each frame;
+        # each yoke keeps its presses in order so `Player.parse_key`
+        # applies them all, and an idle yoke still reports None
+        actions = [[] for _ in YOKES]
         key = self.screen.getch()
-
-        for i, yoke in enumerate(yokes, start=1):
-            if key in yoke:
-                key_presses.append(KeyPress(i, yoke[key]))
-            else:
-                key_presses.append(KeyPress(i, None))
-
-        return key_presses
+        while key != -1:
+            for i, yoke in enumerate(YOKES):
+                action = yoke.get(key)
+                if action is not None:
+                    actions[i].append(action)
+            key = self.screen.getch()
+
+        return [
+            KeyPress(i, action)
+            for i, yoke_actions in enumerate(actions, start=1)
+            for action in yoke_actions or [None]
+        ]
 
 
 @dataclass
@@ -240,6 +285,8 @@ class NetworkGame(Game):
     last_ping: float = None
 
     def __post_init__(self) -> None:
+        super().__post_init__()
+
         # create client that will connect to Server
         host = self.settings['host_ip']
         port = self.settings['host_port']
@@ -316,5 +363,9 @@ class NetworkGame(Game):
                 return [KeyPress(p_id, k) for p_id, k in recv.items()]
 
     def close_game(self) -> None:
-        _ = self.client.receive()
+        try:
+            _ = self.client.receive()
+        except ConnectionError:
+            # nothing left to drain if the server already went away
+            pass
         self.client.close()
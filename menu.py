@@ -4,7 +4,6 @@ import curses
 import sys
 from abc import ABC, abstractmethod
 from configparser import ConfigParser, SectionProxy
-from copy import copy
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Tuple
@@ -17,6 +16,26 @@ ENTER_KEY = 10
 Q_KEY = ord('Q')
 SPACE_KEY = ord(' ')
 
+# === navigation hints shown on the bottom arena border ===
+NAV_HINTS = '──'.join(
+    f' < {k} > {v} ' for k, v in [('Q', 'Close Game'), ('Space', 'GO!')]
+)
+
+
+# cursor visibility last passed to curses (None until first set)
+_cursor_visibility = None
+
+
+def set_cursor_visibility(visibility: int) -> None:
+    '''
+    Calls `curses.curs_set` only when the requested visibility differs
+    from the current one
+    '''
+    global _cursor_visibility
+    if visibility != _cursor_visibility:
+        curses.curs_set(visibility)
+        _cursor_visibility = visibility
+
 
 # === Selection Actions ===
 
@@ -33,23 +52,23 @@ class Action(ABC):
 @dataclass
 class SwitchLocal(Action):
     def run_action(self) -> None:
+        # only fields that appear or disappear need redrawing
         for f in self.menu.fields:
-            if f.label in ['Host IP', 'Host port']:
-                f.is_visible = False
-            else:
-                f.is_visible = True
-        self.menu._draw_fields()
+            is_visible = f.label not in ['Host IP', 'Host port']
+            if f.is_visible != is_visible:
+                f.is_visible = is_visible
+                f.display()
 
 
 @dataclass
 class SwitchNetwork(Action):
     def run_action(self) -> None:
+        # only fields that appear or disappear need redrawing
         for f in self.menu.fields:
-            if f.label in ['Player 2 callsign', 'Player 2 plane']:
-                f.is_visible = False
-            else:
-                f.is_visible = True
-        self.menu._draw_fields()
+            is_visible = f.label not in ['Player 2 callsign', 'Player 2 plane']
+            if f.is_visible != is_visible:
+                f.is_visible = is_visible
+                f.display()
 
 
 # === Formatting strategies ===
@@ -73,8 +92,8 @@ class AlignCentre(AlignStrategy):
     value_width: int = (utils.ARENA_WIDTH - 4) // 2
 
     def justify(self, label: str, value: str) -> Tuple[str, str]:
-        label = f'{label:^{str(self.label_width)}}'
-        value = f'{value:^{str(self.value_width)}}'
+        label = f'{label:^{self.label_width}}'
+        value = f'{value:^{self.value_width}}'
         return label, value
 
 
@@ -105,19 +124,24 @@ class Field(ABC):
         self.label_y = utils.ULY + 5 + self.y_pos_shift
         self.label_x = utils.ULX + 2
 
+        # cursor column of an empty centre-justified value
+        self.cursor_base_x = (
+            self.label_x +
+            utils.ARENA_WIDTH // 2 +
+            utils.ARENA_WIDTH // 4 -
+            2
+        )
+
+        # labels never change, so they are justified once
+        self.label_prefix = self.alignment.justify(self.label, '')[0] + ':'
+
     def _update_cursor(self) -> None:
         '''
         Helper method to place cursor at the end of a centre-justified
         text field.
         '''
-        self.cursor_y = copy(self.label_y)
-        self.cursor_x = (
-            copy(self.label_x) +
-            utils.ARENA_WIDTH // 2 +
-            utils.ARENA_WIDTH // 4 +
-            len(self.display_value) // 2 -
-            2
-        )
+        self.cursor_y = self.label_y
+        self.cursor_x = self.cursor_base_x + len(self.display_value) // 2
 
     @abstractmethod
     def read_key(self, key_press: int) -> None:
@@ -129,13 +153,14 @@ class Field(ABC):
         '''
         Control how a menu field is displayed
         '''
-        # collect padded & justified label: value pair
-        label, value = self.alignment.justify(self.label, self.display_value)
+        # collect padded & justified value for the cached label
+        _, value = self.alignment.justify('', self.display_value)
 
         # format field rendering
-        field_string = label + ":" + value
         if self.is_selection and self.is_active:
-            field_string = label + ":" + '  <<' + value[4:-4] + '>>  '
+            field_string = self.label_prefix + '  <<' + value[4:-4] + '>>  '
+        else:
+            field_string = self.label_prefix + value
         attr = curses.A_NORMAL
         if self.is_active:
             attr = curses.A_STANDOUT
@@ -150,9 +175,9 @@ class Field(ABC):
             attr
         )
         if self.accepts_input:
-            curses.curs_set(2)
+            set_cursor_visibility(2)
         else:
-            curses.curs_set(0)
+            set_cursor_visibility(0)
         self._update_cursor()
         self.screen.move(self.cursor_y, self.cursor_x)
 
@@ -163,9 +188,17 @@ class SelectionField(Field):
     selection: List[Tuple[str, Action]] = field(default_factory=list)
     is_selection: bool = True
 
+    def __post_init__(self):
+        super().__post_init__()
+
+        # index of each selectable value in .selection
+        self.selection_idx = {
+            value: i for i, (value, _) in enumerate(self.selection)
+        }
+
     def read_key(self, key_press: int) -> None:
         # get index of current display value in .selection
-        curr_idx = [s[0] for s in self.selection].index(self.display_value)
+        curr_idx = self.selection_idx[self.display_value]
 
         # parse key to get index of new value
         if key_press == curses.KEY_LEFT:
@@ -210,62 +243,44 @@ class Menu(ABC):
     fields: List[Field] = field(default_factory=list)
     alignment: AlignStrategy = field(default=AlignCentre)
 
+    # saved settings, loaded by subclasses and written on close
+    config: ConfigParser = field(default_factory=ConfigParser)
+
     # track state
     active_field_idx: int = field(default=0)
 
-    def _go_prev_field(self):
+    def _step_field(self, step: int) -> None:
+        '''
+        Moves the highlight `step` fields along, skipping 'invisible'
+        fields and wrapping around at either end
+        '''
         # unhighlight current active field
-        self.fields[self.active_field_idx].is_active = False
+        old_field = self.fields[self.active_field_idx]
+        old_field.is_active = False
 
-        # set new active field, skipping 'invisible' fields
-        while True:
-            self.active_field_idx -= 1
-            if self.active_field_idx < 0:
-                self.active_field_idx = len(self.fields) - 1
-            new_field = self.fields[self.active_field_idx]
-            if new_field.is_visible:
-                self.fields[self.active_field_idx].is_active = True
-                break
-            else:
-                continue
-
-        # draw updated field selection
-        self._draw_fields()
+        # set new active field from the positions of visible fields
+        visible = [i for i, f in enumerate(self.fields) if f.is_visible]
+        pos = visible.index(self.active_field_idx)
+        self.active_field_idx = visible[(pos + step) % len(visible)]
+        new_field = self.fields[self.active_field_idx]
+        new_field.is_active = True
 
-    def _go_next_field(self):
-        # unhighlight current active field
-        self.fields[self.active_field_idx].is_active = False
+        # draw updated field selection; only the highlight has moved
+        old_field.display()
+        new_field.display()
 
-        # set new active field, skipping 'invisible' fields
-        while True:
-            self.active_field_idx += 1
-            if self.active_field_idx > len(self.fields) - 1:
-                self.active_field_idx = 0
-            new_field = self.fields[self.active_field_idx]
-            if new_field.is_visible:
-                self.fields[self.active_field_idx].is_active = True
-                break
-            else:
-                continue
-
-        # draw updated field selection
-        self._draw_fields()
+    def _go_prev_field(self):
+        self._step_field(-1)
+
+    def _go_next_field(self):
+        self._step_field(1)
 
     def _draw_fields(self):
         for f in self.fields:
             f.display()
 
     def _update_nav_hints(self):
-
-        standard_hints = [
-            ('Q', 'Close Game'),
-            ('Space', 'GO!')
-        ]
-        hint_string = '──'.join([
-            f' < {k} > {v} ' for k, v in standard_hints
-        ])
-
-        self.screen.addstr(utils.LRY, utils.ULX + 2, hint_string)
+        self.screen.addstr(utils.LRY, utils.ULX + 2, NAV_HINTS)
 
     def open_menu(self) -> dict:
 
@@ -274,6 +289,10 @@ class Menu(ABC):
         self._draw_fields()
         self._update_nav_hints()
 
+        # nothing changes between key presses, so wait for them instead
+        # of polling; the caller sets its own input mode after the menu
+        self.screen.timeout(-1)
+
         while True:
             try:
                 key_press = self.screen.getch()
@@ -291,29 +310,36 @@ class Menu(ABC):
 
                 active_field = self.fields[self.active_field_idx]
                 active_field.read_key(key_press)
-                self.screen.refresh()
+
+                # push every field redrawn for this key in one update
+                self.screen.noutrefresh()
+                curses.doupdate()
             except KeyboardInterrupt:
                 sys.exit('Closed game...')
 
     def close_menu(self) -> dict:
         # clear screen and hide cursor
         self.screen.clear()
-        curses.curs_set(0)
+        set_cursor_visibility(0)
 
-        # save / update settings to disk
+        # save / update settings to disk, reusing the settings loaded
+        # when the menu was built; the file is only rewritten on change
         settings: SectionProxy
-        cp = ConfigParser()
-        cp.read('CONFIG.cfg')
+        cp = self.config
         try:
             settings = cp['settings']
         except KeyError:
             cp.add_section('settings')
             settings = cp['settings']
+        changed = False
         for f in self.fields:
             flabel = f.label.lower().replace(' ', '_')
-            settings[flabel] = f.display_value
-        with Path('CONFIG.cfg').open('w') as outfile:
-            cp.write(outfile)
+            if settings.get(flabel) != f.display_value:
+                settings[flabel] = f.display_value
+                changed = True
+        if changed:
+            with Path('CONFIG.cfg').open('w') as outfile:
+                cp.write(outfile)
 
         # return settings dictionary
         return dict(settings)
@@ -325,7 +351,7 @@ class StartMenu(Menu):
     def __post_init__(self):
 
         # load saved settings
-        cp = ConfigParser()
+        cp = self.config
         cp.read('CONFIG.cfg')
         try:
             settings = cp['settings']
@@ -4,6 +4,8 @@ import socket
 import selectors
 import types
 
+from client import pack_message, pop_frame
+
 sel = selectors.DefaultSelector()
 
 host, port = sys.argv[1], int(sys.argv[2])
@@ -14,20 +16,24 @@ print(f"Listening on {(host, port)}")
 lsock.setblocking(False)
 sel.register(lsock, selectors.EVENT_READ, data=None)
 
-DATA_BUFFER = {'sent_to': []}
+# keys received this round, the peers they have been echoed to and the
+# round's encoded echo (packed once, on the first send)
+DATA_BUFFER = {}
+SENT_TO = set()
+ECHO_MESSAGE = None
 
 
 def accept_wrapper(sock):
     conn, addr = sock.accept()  # Should be ready to read
     print(f"Accepted connection from {addr}")
     conn.setblocking(False)
-    data = types.SimpleNamespace(addr=addr, outb={})
+    data = types.SimpleNamespace(addr=addr, inb=bytearray(), outb=bytearray())
     events = selectors.EVENT_READ | selectors.EVENT_WRITE
     sel.register(conn, events, data=data)
 
 
 def service_connection(key, mask):
-    global DATA_BUFFER
+    global ECHO_MESSAGE
 
     sock = key.fileobj
     data = key.data
@@ -35,27 +41,41 @@ def service_connection(key, mask):
     if mask & selectors.EVENT_READ:
         recv_data = sock.recv(1024)  # Should be ready to read
         if recv_data:
-            try:
-                recv_json = json.loads(recv_data.decode('utf-8'))
-                recv_key = list(recv_json.keys())[0]
-                if recv_key not in data.outb:
-                    DATA_BUFFER.update(recv_json)
-            except json.JSONDecodeError:
-                pass
+            data.inb += recv_data
+            # apply each frame as it is decoded so a corrupt frame (bad
+            # JSON or bad UTF-8) is skipped without losing the others
+            payload = pop_frame(data.inb)
+            while payload is not None:
+                try:
+                    DATA_BUFFER.update(json.loads(payload))
+                except ValueError:
+                    pass
+                payload = pop_frame(data.inb)
         else:
             print(f"Closing connection to {data.addr}")
             sel.unregister(sock)
             sock.close()
+            return
     if mask & selectors.EVENT_WRITE:
-        if DATA_BUFFER and len(DATA_BUFFER) == 3:
-            if data.addr not in DATA_BUFFER['sent_to']:
-                only_data = {k: v for k, v in DATA_BUFFER.items() if k != 'sent_to'}
-                print(f"Echoing {only_data} to {data.addr}")
-                send_json = json.dumps(only_data).encode('utf-8')
-                sock.send(send_json)  # Should be ready to write
-                DATA_BUFFER['sent_to'].append(data.addr)
-            if len(DATA_BUFFER['sent_to']) == 2:
-                DATA_BUFFER = {'sent_to': []}
+        if len(DATA_BUFFER) == 2:
+            if data.addr not in SENT_TO:
+                if ECHO_MESSAGE is None:
+                    ECHO_MESSAGE = pack_message(DATA_BUFFER)
+                print(f"Echoing {DATA_BUFFER} to {data.addr}")
+                data.outb += ECHO_MESSAGE
+                SENT_TO.add(data.addr)
+            if len(SENT_TO) == 2:
+                DATA_BUFFER.clear()
+                SENT_TO.clear()
+                ECHO_MESSAGE = None
+        # send what the socket accepts now; the rest goes out on a later
+        # writable event so frames are never cut short
+        if data.outb:
+            try:
+                sent = sock.send(data.outb)
+            except BlockingIOError:
+                sent = 0
+            del data.outb[:sent]
 
 
 # the event loop
@@ -0,0 +1,81 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from client import HEADER_SIZE, pack_message, pop_frame  # noqa: E402
+from client import unpack_messages  # noqa: E402
+
+
+class TestMessageFraming(unittest.TestCase):
+
+    def setUp(self):
+
+        self.msg_one = {'abc': 'up'}
+        self.msg_two = {'abc': None, 'def': 'shoot'}
+        self.frame_one = pack_message(self.msg_one)
+        self.frame_two = pack_message(self.msg_two)
+
+    def test_pack_message_length_prefix(self):
+
+        payload_size = int.from_bytes(self.frame_one[:HEADER_SIZE], 'big')
+
+        self.assertEqual(payload_size, len(self.frame_one) - HEADER_SIZE)
+
+    def test_unpack_single_frame(self):
+
+        buffer = bytearray(self.frame_one)
+
+        self.assertEqual(unpack_messages(buffer), [self.msg_one])
+        self.assertEqual(buffer, bytearray())
+
+    def test_unpack_several_frames_in_one_read(self):
+
+        buffer = bytearray(self.frame_one + self.frame_two + self.frame_one)
+
+        self.assertEqual(
+            unpack_messages(buffer),
+            [self.msg_one, self.msg_two, self.msg_one]
+        )
+        self.assertEqual(buffer, bytearray())
+
+    def test_unpack_split_frame(self):
+
+        split = len(self.frame_two) // 2
+        buffer = bytearray(self.frame_two[:split])
+
+        self.assertEqual(unpack_messages(buffer), [])
+        self.assertEqual(buffer, bytearray(self.frame_two[:split]))
+
+        buffer += self.frame_two[split:]
+
+        self.assertEqual(unpack_messages(buffer), [self.msg_two])
+        self.assertEqual(buffer, bytearray())
+
+    def test_unpack_partial_header(self):
+
+        buffer = bytearray(self.frame_one + self.frame_two[:HEADER_SIZE - 1])
+
+        self.assertEqual(unpack_messages(buffer), [self.msg_one])
+        self.assertEqual(buffer, bytearray(self.frame_two[:HEADER_SIZE - 1]))
+
+        buffer += self.frame_two[HEADER_SIZE - 1:]
+
+        self.assertEqual(unpack_messages(buffer), [self.msg_two])
+        self.assertEqual(buffer, bytearray())
+
+    def test_pop_frame_skips_corrupt_frame(self):
+
+        bad_payload = b'{"abc": "\xff"}'
+        bad_frame = len(bad_payload).to_bytes(HEADER_SIZE, 'big') + bad_payload
+        buffer = bytearray(self.frame_one + bad_frame + self.frame_two)
+
+        self.assertEqual(pop_frame(buffer), self.frame_one[HEADER_SIZE:])
+        self.assertEqual(pop_frame(buffer), bad_payload)
+        self.assertEqual(unpack_messages(buffer), [self.msg_two])
+        self.assertIsNone(pop_frame(buffer))
+
+
+if __name__ == '__main__':
+    unittest.main()
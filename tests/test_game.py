@@ -0,0 +1,102 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# utils centres the arena on the terminal when imported
+TERMINAL_SIZE = os.terminal_size((120, 40))
+with mock.patch('os.get_terminal_size', return_value=TERMINAL_SIZE):
+    from base import Player  # noqa: E402
+    from game import LocalGame, P_ONE_YOKE, P_TWO_YOKE  # noqa: E402
+    from utils import KeyPress  # noqa: E402
+
+
+class FakeScreen:
+    '''
+    Returns queued key codes from `getch`, then -1 once drained
+    '''
+    def __init__(self, keys):
+        self.keys = list(keys)
+
+    def getch(self):
+        return self.keys.pop(0) if self.keys else -1
+
+
+class FakePlane:
+    '''
+    Records the controls a `Player` applies to its plane
+    '''
+    def __init__(self):
+        self.pitch_changes = []
+        self.shots = 0
+        self.fired_cannon = []
+
+    def _change_pitch(self, up):
+        self.pitch_changes.append(up)
+
+    def _fire_cannon(self):
+        self.shots += 1
+        return 'round'
+
+
+def key_for(yoke, action):
+    return next(k for k, a in yoke.items() if a == action)
+
+
+class TestLocalReadKey(unittest.TestCase):
+
+    def read_key(self, keys):
+        game = LocalGame(FakeScreen(keys), None, {}, [])
+        return game.read_key()
+
+    def test_no_keys_reports_none_for_each_player(self):
+
+        self.assertEqual(
+            self.read_key([]),
+            [KeyPress(1, None), KeyPress(2, None)]
+        )
+
+    def test_every_press_is_kept_in_order(self):
+
+        keys = [
+            key_for(P_TWO_YOKE, 'up'),
+            key_for(P_ONE_YOKE, 'shoot'),
+            key_for(P_TWO_YOKE, 'shoot'),
+            key_for(P_ONE_YOKE, 'up'),
+            key_for(P_ONE_YOKE, 'up'),
+        ]
+
+        self.assertEqual(
+            self.read_key(keys),
+            [
+                KeyPress(1, 'shoot'),
+                KeyPress(1, 'up'),
+                KeyPress(1, 'up'),
+                KeyPress(2, 'up'),
+                KeyPress(2, 'shoot'),
+            ]
+        )
+
+    def test_idle_player_reports_none(self):
+
+        self.assertEqual(
+            self.read_key([key_for(P_TWO_YOKE, 'down')]),
+            [KeyPress(1, None), KeyPress(2, 'down')]
+        )
+
+    def test_shoot_and_pitch_in_one_frame_both_apply(self):
+
+        keys = [key_for(P_ONE_YOKE, 'shoot'), key_for(P_ONE_YOKE, 'down')]
+        player = Player(player_id=1, plane=FakePlane())
+
+        player.parse_key(self.read_key(keys))
+
+        self.assertEqual(player.plane.shots, 1)
+        self.assertEqual(player.plane.fired_cannon, ['round'])
+        self.assertEqual(player.plane.pitch_changes, [False])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import copy
 import curses
 import math
 import os
+import sys
 from collections import namedtuple
 from dataclasses import dataclass
 from typing import Any, Tuple, TYPE_CHECKING, Union
@@ -16,6 +16,11 @@ else:
     Window = Any
 
 
+# keyword arguments for `dataclass` on frequently-instantiated sprite
+# classes; `slots` is only accepted from python 3.10
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 # === helper data structures ===
 KeyPress = namedtuple('KeyPress', 'player_id key')
 
@@ -42,7 +47,14 @@ LRY = ARENA_HEIGHT + Y_SHIFT
 LRX = ARENA_WIDTH + X_SHIFT
 
 
-@dataclass
+def inside_arena(y: int, x: int) -> bool:
+    '''
+    Returns True if the cell (y, x) lies inside the arena boundary
+    '''
+    return ULY < y < LRY and ULX < x < LRX
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Vector:
     y: float
     x: float
@@ -51,7 +63,8 @@ class Vector:
         return round(self.y), round(self.x)
 
     def __copy__(self):
-        return Vector(copy.copy(self.y), copy.copy(self.x))
+        # floats are immutable, so sharing them is a full copy
+        return Vector(self.y, self.x)
 
     def __round__(self) -> Vector:
         return Vector(round(self.y), round(self.x))
@@ -60,40 +73,61 @@ class Vector:
         return iter((self.y, self.x))
 
     def __getitem__(self, key: slice) -> float:
-        return [self.y, self.x][key]
+        return (self.y, self.x)[key]
 
     def __add__(self, other: Union[int, Vector]) -> Vector:
-        if isinstance(other, Vector):
+        if type(other) is Vector:
             return Vector(self.y + other.y, self.x + other.x)
-        elif isinstance(other, float) or isinstance(other, int):
+        elif isinstance(other, (float, int)):
             return Vector(self.y + other, self.x + other)
         else:
             raise TypeError('can only operate on another Vector')
 
     def __sub__(self, other: Union[int, Vector]) -> Vector:
-        if isinstance(other, Vector):
+        if type(other) is Vector:
             return Vector(self.y - other.y, self.x - other.x)
-        elif isinstance(other, float) or isinstance(other, int):
+        elif isinstance(other, (float, int)):
             return Vector(self.y - other, self.x - other)
         else:
             raise TypeError('can only operate on another Vector')
 
     def __mul__(self, other: Union[int, Vector]) -> Vector:
-        if isinstance(other, Vector):
+        if type(other) is Vector:
             return Vector(self.y * other.y, self.x * other.x)
-        elif isinstance(other, float) or isinstance(other, int):
+        elif isinstance(other, (float, int)):
             return Vector(self.y * other, self.x * other)
         else:
             raise TypeError('can only operate on another Vector')
 
 
+def _compute_direction(angle: float) -> Tuple[float, float]:
+    return round(math.cos(angle), 5), round(math.sin(angle), 5)
+
+
+# === direction lookup table ===
+# planes turn in fixed steps of pi/8 so nearly every angle in play
+# sits on one of 16 compass points; their directions are precomputed
+DIRECTION_STEPS = 16
+DIRECTION_STEP_ANGLE = 2 * math.pi / DIRECTION_STEPS
+DIRECTION_LUT = [
+    _compute_direction(i * DIRECTION_STEP_ANGLE)
+    for i in range(DIRECTION_STEPS)
+]
+
+
 def resolve_direction(angle: float) -> Vector:
     '''
     Converts a Radian value to a Vector with y- and x-values
-    '''
 
-    y = round(math.cos(angle), 5)
-    x = round(math.sin(angle), 5)
+    Angles on one of the `DIRECTION_STEPS` compass points are read from
+    `DIRECTION_LUT`; any other angle falls back to live trigonometry.
+    '''
+    step = angle / DIRECTION_STEP_ANGLE
+    idx = round(step)
+    if abs(step - idx) < 1e-9:
+        y, x = DIRECTION_LUT[idx % DIRECTION_STEPS]
+    else:
+        y, x = _compute_direction(angle)
     return Vector(y, x)
 
 